@@ -13,22 +13,33 @@ def emit_result(requires_python=None, error=None, message=None):
 
 
 try:
-    import tomllib
-except Exception:
+    pyproject_file = path.open("rb")
+except OSError as exc:
+    emit_result(error="parse_failed", message=f"Failed to read pyproject.toml: {exc}")
+    raise SystemExit(0)
+
+with pyproject_file:
+    # Import the parser only after the file has been opened successfully.
+    if sys.version_info >= (3, 11):
+        import tomllib
+    else:
+        try:
+            import tomli as tomllib
+        except ModuleNotFoundError:
+            emit_result(
+                error="toml_parser_unavailable",
+                message="tomllib/tomli is unavailable for parsing pyproject.toml.",
+            )
+            raise SystemExit(0)
+
     try:
-        import tomli as tomllib
-    except Exception:
-        emit_result(
-            error="toml_parser_unavailable",
-            message="tomllib/tomli is unavailable for parsing pyproject.toml.",
-        )
+        data = tomllib.load(pyproject_file)
+    except OSError as exc:
+        emit_result(error="parse_failed", message=f"Failed to read pyproject.toml: {exc}")
+        raise SystemExit(0)
+    except Exception as exc:
+        emit_result(error="parse_failed", message=f"Failed to parse pyproject.toml: {exc}")
         raise SystemExit(0)
-
-try:
-    data = tomllib.loads(path.read_text(encoding="utf-8"))
-except Exception as exc:
-    emit_result(error="parse_failed", message=f"Failed to parse pyproject.toml: {exc}")
-    raise SystemExit(0)
 
 project = data.get("project") if isinstance(data, dict) else None
 requires_python = project.get("requires-python") if isinstance(project, dict) else None
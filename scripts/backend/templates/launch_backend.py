@@ -1,7 +1,9 @@
 from __future__ import annotations
 
 import ctypes
+import fnmatch
 import os
+import re
 import runpy
 import sys
 from pathlib import Path
@@ -9,6 +11,19 @@ from pathlib import Path
 BACKEND_DIR = Path(__file__).resolve().parent
 APP_DIR = BACKEND_DIR / "app"
 _WINDOWS_DLL_DIRECTORY_HANDLES: list[object] = []
+# DLL name patterns preloaded on Windows, in load order. Each pattern is its
+# own capturing group so a match's lastindex gives its position in the list.
+_WINDOWS_PRELOAD_DLL_PATTERNS = (
+    "python3.dll",
+    "python*.dll",
+    "vcruntime*.dll",
+    "libcrypto-*.dll",
+    "libssl-*.dll",
+)
+_WINDOWS_PRELOAD_DLL_RE = re.compile(
+    "|".join(f"({fnmatch.translate(pattern)})" for pattern in _WINDOWS_PRELOAD_DLL_PATTERNS),
+    re.IGNORECASE,
+)
 
 
 def configure_stdio_utf8() -> None:
@@ -30,50 +45,48 @@ def configure_windows_dll_search_path() -> None:
     if sys.platform != "win32" or not hasattr(os, "add_dll_directory"):
         return
 
-    runtime_executable_dir = Path(sys.executable).resolve().parent
+    runtime_executable_dir = str(Path(sys.executable).resolve().parent)
+    backend_runtime_dir = os.path.join(str(BACKEND_DIR), "python")
     site_packages_dirs = [
-        runtime_executable_dir / "Lib" / "site-packages",
-        BACKEND_DIR / "python" / "Lib" / "site-packages",
+        os.path.join(runtime_executable_dir, "Lib", "site-packages"),
+        os.path.join(backend_runtime_dir, "Lib", "site-packages"),
     ]
     candidates = [
         runtime_executable_dir,
-        runtime_executable_dir / "DLLs",
-        BACKEND_DIR / "python",
-        BACKEND_DIR / "python" / "DLLs",
+        os.path.join(runtime_executable_dir, "DLLs"),
+        backend_runtime_dir,
+        os.path.join(backend_runtime_dir, "DLLs"),
     ]
     for site_packages_dir in site_packages_dirs:
         candidates.extend(
             [
-                site_packages_dir / "cryptography.libs",
-                site_packages_dir / "cryptography" / "hazmat" / "bindings",
+                os.path.join(site_packages_dir, "cryptography.libs"),
+                os.path.join(site_packages_dir, "cryptography", "hazmat", "bindings"),
             ],
         )
 
     normalized_added: set[str] = set()
     path_entries: list[str] = []
     for candidate in candidates:
-        if not candidate.is_dir():
-            continue
-        candidate_str = str(candidate)
-        candidate_key = candidate_str.lower()
+        candidate_key = candidate.lower()
         if candidate_key in normalized_added:
             continue
         normalized_added.add(candidate_key)
-        path_entries.append(candidate_str)
+        # add_dll_directory raises OSError for missing directories, so no
+        # separate is_dir() stat is needed before registering a candidate.
         try:
             _WINDOWS_DLL_DIRECTORY_HANDLES.append(
-                os.add_dll_directory(candidate_str),
+                os.add_dll_directory(candidate),
             )
         except OSError:
             continue
+        path_entries.append(candidate)
 
     if path_entries:
         existing_path = os.environ.get("PATH", "")
-        os.environ["PATH"] = (
-            ";".join(path_entries + [existing_path])
-            if existing_path
-            else ";".join(path_entries)
-        )
+        if existing_path:
+            path_entries.append(existing_path)
+        os.environ["PATH"] = ";".join(path_entries)
 
 
 def preload_windows_runtime_dlls() -> None:
@@ -90,27 +103,32 @@ def preload_windows_runtime_dlls() -> None:
         backend_runtime_dir,
         backend_runtime_dll_dir,
     ]
-    patterns = [
-        "python3.dll",
-        "python*.dll",
-        "vcruntime*.dll",
-        "libcrypto-*.dll",
-        "libssl-*.dll",
-    ]
     loaded: set[str] = set()
     for candidate_dir in candidate_dirs:
-        if not candidate_dir.is_dir():
+        # One directory listing per candidate, matched against the precompiled
+        # pattern union; sorting by pattern index keeps the listed load order.
+        try:
+            with os.scandir(candidate_dir) as entries:
+                matches = []
+                for entry in entries:
+                    match = _WINDOWS_PRELOAD_DLL_RE.match(entry.name)
+                    if match is not None and entry.is_file():
+                        matches.append((match.lastindex, entry.name))
+        except OSError:
             continue
-        for pattern in patterns:
-            for dll_path in candidate_dir.glob(pattern):
-                normalized_path = str(dll_path.resolve()).lower()
-                if normalized_path in loaded:
-                    continue
-                loaded.add(normalized_path)
-                try:
-                    ctypes.WinDLL(str(dll_path))
-                except OSError:
-                    continue
+        matches.sort(key=lambda item: item[0])
+        for _, file_name in matches:
+            dll_path = candidate_dir / file_name
+            # Candidate dirs are already resolved, so normcase is enough to
+            # dedupe without another resolve() round-trip per DLL.
+            normalized_path = os.path.normcase(str(dll_path))
+            if normalized_path in loaded:
+                continue
+            loaded.add(normalized_path)
+            try:
+                ctypes.WinDLL(str(dll_path))
+            except OSError:
+                continue
 
 
 configure_stdio_utf8()
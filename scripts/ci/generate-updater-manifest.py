@@ -23,6 +23,45 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# One alternation per OS; each branch captures the arch under the manifest OS name.
+_PLATFORM_RE = re.compile(
+    r"AstrBot_.*_(?:"
+    r"windows_(?P<windows>x86_64|aarch64|armv7|amd64|arm64)_updater(?:\.msi\.zip|\.zip|\.exe|\.msi)$"
+    r"|linux_(?P<linux>x86_64|aarch64|armv7|amd64|arm64)_updater\.tar\.gz"
+    r"|macos_(?P<darwin>x86_64|aarch64|universal|amd64|arm64)_updater\.tar\.gz"
+    r")",
+    re.IGNORECASE,
+)
+# Normalized artifact arch names mapped back to the names Tauri expects.
+_ARCH_ALIASES = {
+    "amd64": "x86_64",
+    "arm64": "aarch64",
+}
+
+# Updater bundle filename suffixes, in ascending precedence order.
+_UPDATER_BUNDLE_SUFFIXES = (
+    "_updater.exe",
+    "_updater.msi",
+    "_updater.msi.zip",
+    "_updater.zip",
+    "_updater.tar.gz",
+)
+
+
+def write_json(path: Path, data: dict[str, Any]) -> None:
+    """Write JSON with 2-space indentation, preferring orjson when available."""
+    if orjson is not None:
+        path.write_bytes(
+            orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+        )
+        return
+    path.write_text(json.dumps(data, indent=2) + "\n", encoding="utf-8")
+
 
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Generate Tauri updater manifest")
@@ -74,58 +113,33 @@ def extract_platform_info(filename: str) -> dict[str, str] | None:
     where {arch} supports both legacy names (x86_64/aarch64)
     and normalized artifact names (amd64/arm64).
     """
-    patterns = [
-        # Windows
-        (
-            r"AstrBot_.*_windows_(x86_64|aarch64|armv7|amd64|arm64)_updater(?:\.msi\.zip|\.zip|\.exe|\.msi)$",
-            "windows",
-            None,
-        ),
-        # Linux
-        (r"AstrBot_.*_linux_(x86_64|aarch64|armv7|amd64|arm64)_updater\.tar\.gz", "linux", None),
-        # macOS
-        (r"AstrBot_.*_macos_(x86_64|aarch64|universal|amd64|arm64)_updater\.tar\.gz", "darwin", None),
-    ]
-
-    for pattern, os_name, _ in patterns:
-        match = re.search(pattern, filename, re.IGNORECASE)
-        if match:
-            arch = match.group(1).lower()
-            # Normalize architecture names
-            arch_map = {
-                "x86_64": "x86_64",
-                "aarch64": "aarch64",
-                "armv7": "armv7",
-                "universal": "universal",
-                "amd64": "x86_64",
-                "arm64": "aarch64",
-            }
-            normalized_arch = arch_map.get(arch, arch)
-            return {"os": os_name, "arch": normalized_arch}
-
-    return None
+    match = _PLATFORM_RE.search(filename)
+    if not match:
+        return None
+
+    # Exactly one branch matches; its group name is the manifest OS name.
+    os_name = match.lastgroup
+    arch = match.group(os_name).lower()
+    return {"os": os_name, "arch": _ARCH_ALIASES.get(arch, arch)}
 
 
 def find_updater_artifacts(artifact_dir: Path) -> list[Path]:
-    """Find all updater artifacts in the directory."""
-    artifacts = []
-    patterns = [
-        "*_updater.exe",
-        "*_updater.exe.sig",
-        "*_updater.msi",
-        "*_updater.msi.sig",
-        "*_updater.msi.zip",
-        "*_updater.msi.zip.sig",
-        "*_updater.zip",
-        "*_updater.zip.sig",
-        "*_updater.tar.gz",
-        "*_updater.tar.gz.sig",
-    ]
-
-    for pattern in patterns:
-        artifacts.extend(artifact_dir.glob(f"**/{pattern}"))
-
-    return artifacts
+    """Find all updater bundles in the directory with a single tree walk.
+
+    Signature files are not collected; callers derive ``<bundle>.sig`` paths.
+    Results are grouped in ``_UPDATER_BUNDLE_SUFFIXES`` order so later bundle
+    kinds keep taking precedence for the same platform.
+    """
+    buckets: dict[str, list[Path]] = {suffix: [] for suffix in _UPDATER_BUNDLE_SUFFIXES}
+
+    for dirpath, _, filenames in os.walk(artifact_dir):
+        for filename in filenames:
+            for suffix in _UPDATER_BUNDLE_SUFFIXES:
+                if filename.endswith(suffix):
+                    buckets[suffix].append(Path(dirpath, filename))
+                    break
+
+    return [artifact for suffix in _UPDATER_BUNDLE_SUFFIXES for artifact in buckets[suffix]]
 
 
 def read_signature_file(sig_path: Path) -> str:
@@ -140,57 +154,41 @@ def generate_manifest(
     version: str,
     release_tag: str,
     repository: str,
+    pub_date: str,
     strict_version_match: bool = False,
 ) -> dict[str, Any]:
     """Generate the updater manifest."""
     manifest: dict[str, Any] = {
         "version": version,
         "notes": f"Release {release_tag}",
-        "pub_date": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
+        "pub_date": pub_date,
         "platforms": {},
     }
 
-    # Group artifacts by platform
-    artifact_map: dict[str, dict[str, Path]] = {}
+    base_url = f"https://github.com/{repository}/releases/download/{release_tag}"
+    platforms: dict[str, dict[str, str]] = manifest["platforms"]
 
+    # Write each bundle straight into the platforms section; later bundles
+    # for the same platform replace earlier ones.
     for artifact in artifacts:
-        if artifact.suffix == ".sig":
-            continue  # Skip signature files for now
-
         info = extract_platform_info(artifact.name)
         if not info:
             print(f"Warning: Could not extract platform info from {artifact.name}", file=sys.stderr)
             continue
 
-        os_name = info["os"]
-        arch = info["arch"]
-        key = f"{os_name}-{arch}"
-
-        artifact_map[key] = {
-            "bundle": artifact,
-            "signature": artifact.parent / f"{artifact.name}.sig",
-        }
-
-    # Build platforms section
-    base_url = f"https://github.com/{repository}/releases/download/{release_tag}"
-
-    for platform_key, paths in artifact_map.items():
-        bundle_path = paths["bundle"]
-        sig_path = paths["signature"]
+        platform_key = f"{info['os']}-{info['arch']}"
 
-        # Read signature
         try:
-            signature = read_signature_file(sig_path)
+            signature = read_signature_file(artifact.parent / f"{artifact.name}.sig")
         except FileNotFoundError:
-            print(f"Warning: Signature not found for {bundle_path.name}", file=sys.stderr)
+            print(f"Warning: Signature not found for {artifact.name}", file=sys.stderr)
+            # The preferred bundle is unsigned, so do not fall back to an older one.
+            platforms.pop(platform_key, None)
             continue
 
-        # Generate download URL
-        download_url = f"{base_url}/{bundle_path.name}"
-
-        manifest["platforms"][platform_key] = {
+        platforms[platform_key] = {
             "signature": signature,
-            "url": download_url,
+            "url": f"{base_url}/{artifact.name}",
         }
 
     return manifest
@@ -204,6 +202,9 @@ def main() -> int:
         print(f"Error: Artifact root does not exist: {artifact_root}", file=sys.stderr)
         return 1
 
+    # One timestamp for both the empty and the populated manifest.
+    pub_date = datetime.now(timezone.utc).isoformat(timespec="seconds").replace("+00:00", "Z")
+
     # Find updater artifacts
     updater_artifacts = find_updater_artifacts(artifact_root)
 
@@ -213,7 +214,7 @@ def main() -> int:
         manifest = {
             "version": args.version,
             "notes": f"Release {args.release_tag}",
-            "pub_date": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
+            "pub_date": pub_date,
             "platforms": {},
         }
     else:
@@ -225,6 +226,7 @@ def main() -> int:
             args.version,
             args.release_tag,
             args.repository,
+            pub_date,
             args.strict_version_match,
         )
 
@@ -232,8 +234,7 @@ def main() -> int:
     output_path = Path(args.output)
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
-    with output_path.open("w", encoding="utf-8") as f:
-        json.dump(manifest, f, indent=2)
+    write_json(output_path, manifest)
 
     print(f"Generated updater manifest: {output_path}", file=sys.stderr)
     print(f"Platforms: {list(manifest['platforms'].keys())}", file=sys.stderr)
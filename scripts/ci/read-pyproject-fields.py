@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""Read one or more fields from a pyproject.toml with a single parse.
+
+Prints a JSON object whose keys are the last segment of each dotted field
+path with dashes replaced by underscores, for example:
+
+    read-pyproject-fields.py pyproject.toml \
+        --field project.version --field project.requires-python
+    {"version": "4.19.0", "requires_python": ">=3.10"}
+
+Missing fields are reported as null. Fields whose output keys collide (for
+example project.version and tool.poetry.version) are rejected.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import pathlib
+import sys
+from typing import Any
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Read fields from pyproject.toml")
+    parser.add_argument("pyproject", help="Path to pyproject.toml")
+    parser.add_argument(
+        "--field",
+        dest="fields",
+        action="append",
+        required=True,
+        help="Dotted field path to read (repeatable), e.g. project.version",
+    )
+    return parser.parse_args()
+
+
+def get_field(data: dict[str, Any], field: str) -> Any:
+    current: Any = data
+    for key in field.split("."):
+        if not isinstance(current, dict):
+            return None
+        current = current.get(key)
+    return current
+
+
+def output_key(field: str) -> str:
+    return field.rsplit(".", 1)[-1].replace("-", "_")
+
+
+def main() -> int:
+    args = parse_args()
+
+    fields_by_key: dict[str, str] = {}
+    for field in args.fields:
+        key = output_key(field)
+        if fields_by_key.setdefault(key, field) != field:
+            print(
+                f"Fields {fields_by_key[key]!r} and {field!r} both map to output key {key!r}",
+                file=sys.stderr,
+            )
+            return 2
+
+    pyproject_path = pathlib.Path(args.pyproject)
+    if not pyproject_path.is_file():
+        print(f"File not found: {pyproject_path}", file=sys.stderr)
+        return 2
+
+    # Import the parser only once a TOML file actually needs parsing.
+    if sys.version_info >= (3, 11):
+        import tomllib
+    else:
+        try:
+            import tomli as tomllib
+        except ModuleNotFoundError:
+            print("No TOML parser available: install Python 3.11+ or add dependency 'tomli'.", file=sys.stderr)
+            return 1
+    try:
+        with pyproject_path.open("rb") as pyproject_file:
+            data = tomllib.load(pyproject_file)
+    except OSError as exc:
+        print(f"Failed to read {pyproject_path}: {exc}", file=sys.stderr)
+        return 1
+    except Exception as exc:
+        print(f"Failed to parse {pyproject_path}: {exc}", file=sys.stderr)
+        return 1
+
+    print(json.dumps({key: get_field(data, field) for key, field in fields_by_key.items()}))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
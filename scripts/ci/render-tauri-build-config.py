@@ -19,6 +19,21 @@ import sys
 from pathlib import Path
 from typing import Any
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def write_json(path: Path, data: dict[str, Any]) -> None:
+    """Write JSON with 2-space indentation, preferring orjson when available."""
+    if orjson is not None:
+        path.write_bytes(
+            orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+        )
+        return
+    path.write_text(json.dumps(data, indent=2) + "\n", encoding="utf-8")
+
 
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Render Tauri build config")
@@ -71,8 +86,7 @@ def main() -> int:
     output_path = Path(args.output)
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
-    with output_path.open("w", encoding="utf-8") as f:
-        json.dump(config, f, indent=2)
+    write_json(output_path, config)
 
     print(f"Generated Tauri build config: {output_path}", file=sys.stderr)
 
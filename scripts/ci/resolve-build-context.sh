@@ -353,7 +353,15 @@ if [ "${should_build}" = "true" ]; then
     git -C "${repo_dir}" remote add origin "${source_git_url}"
     git -C "${repo_dir}" fetch --depth 1 origin "${source_git_ref}"
     git -C "${repo_dir}" checkout --detach FETCH_HEAD
-    version="$(python3 scripts/ci/read-project-version.py "${repo_dir}/pyproject.toml")"
+    # Only project.version is needed here. Reading it through the shared JSON
+    # helper keeps one pyproject reader in CI, and jq's `strings` drops a
+    # missing or non-string value so the empty check below rejects it.
+    pyproject_fields="$(python3 scripts/ci/read-pyproject-fields.py "${repo_dir}/pyproject.toml" --field project.version)"
+    version="$(printf '%s' "${pyproject_fields}" | jq -r '.version | strings | gsub("^\\s+|\\s+$"; "")')"
+    if [ -z "${version}" ]; then
+      echo "Unable to resolve project.version from ${repo_dir}/pyproject.toml" >&2
+      exit 1
+    fi
   fi
 else
   version="${source_git_ref#v}"
@@ -22,7 +22,8 @@ def get_nested(data: dict[str, Any], keys: tuple[str, ...]) -> Any:
 
 def normalize_bundle_name(name: str) -> str:
     normalized = name.strip()
-    if normalized.lower().endswith(".app"):
+    # Lowercase only the suffix instead of copying the whole name.
+    if normalized[-4:].lower() == ".app":
         normalized = normalized[:-4]
     return normalized.strip()
 
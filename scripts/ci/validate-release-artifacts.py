@@ -2,9 +2,22 @@
 
 from __future__ import annotations
 
+import os
 import pathlib
 import sys
-from collections import defaultdict
+from collections import Counter, defaultdict
+from collections.abc import Iterator
+
+
+def iter_files(directory: str) -> Iterator[os.DirEntry[str]]:
+    # Mirror rglob semantics: report file symlinks, but do not descend into
+    # symlinked directories.
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                yield from iter_files(entry.path)
+            elif entry.is_file():
+                yield entry
 
 
 def main() -> int:
@@ -20,13 +33,16 @@ def main() -> int:
         print(f"Artifacts path is not a directory: {root}", file=sys.stderr)
         return 1
 
-    by_name: dict[str, list[pathlib.Path]] = defaultdict(list)
-    for path in root.rglob("*"):
-        if path.is_file():
-            by_name[path.name].append(path)
+    entries = list(iter_files(str(root)))
+    name_counts = Counter(entry.name for entry in entries)
+    duplicate_names = {name for name, count in name_counts.items() if count > 1}
+    if duplicate_names:
+        # Only collect full path lists on the failure path.
+        duplicates: dict[str, list[str]] = defaultdict(list)
+        for entry in entries:
+            if entry.name in duplicate_names:
+                duplicates[entry.name].append(entry.path)
 
-    duplicates = {name: paths for name, paths in by_name.items() if len(paths) > 1}
-    if duplicates:
         print("Duplicate artifact filenames detected after merge:", file=sys.stderr)
         for name, paths in sorted(duplicates.items()):
             print(f"- {name}", file=sys.stderr)
@@ -15,6 +15,12 @@ import time
 import urllib.parse
 import urllib.request
 
+# Release tag -> {asset name: asset metadata}, fetched at most once per release.
+_RELEASE_ASSETS_CACHE: dict[str, dict[str, dict]] = {}
+# 1 MiB reads keep Python-level read/write calls to ~60 for a 60 MiB archive;
+# shutil.copyfileobj would default to much smaller chunks.
+_DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
 
 def _require_env(name: str) -> str:
     value = (os.environ.get(name) or "").strip()
@@ -23,14 +29,18 @@ def _require_env(name: str) -> str:
     return value
 
 
-def _download_with_retries(url: str, output_path: pathlib.Path, retries: int = 3) -> None:
+def _download_with_retries(url: str, output_path: pathlib.Path, retries: int = 3) -> str:
     last_error: Exception | None = None
     for attempt in range(1, retries + 1):
         try:
+            # Hash while writing; a fresh digest per attempt keeps retries correct.
+            digest = hashlib.sha256()
             with urllib.request.urlopen(url, timeout=180) as response:
                 with output_path.open("wb") as output:
-                    shutil.copyfileobj(response, output)
-            return
+                    while chunk := response.read(_DOWNLOAD_CHUNK_SIZE):
+                        digest.update(chunk)
+                        output.write(chunk)
+            return digest.hexdigest()
         except Exception as exc:
             last_error = exc
             if attempt >= retries:
@@ -74,7 +84,11 @@ def _read_json_with_retries(url: str, retries: int = 3) -> dict:
     raise RuntimeError(f"Failed to fetch release metadata: {url}") from last_error
 
 
-def _resolve_expected_sha256(release: str, asset_name: str) -> str:
+def _get_release_assets_by_name(release: str) -> dict[str, dict]:
+    cached_assets = _RELEASE_ASSETS_CACHE.get(release)
+    if cached_assets is not None:
+        return cached_assets
+
     release_api_url = (
         "https://api.github.com/repos/astral-sh/python-build-standalone/releases/tags/"
         f"{urllib.parse.quote(release)}"
@@ -84,14 +98,17 @@ def _resolve_expected_sha256(release: str, asset_name: str) -> str:
     if not isinstance(assets, list):
         raise RuntimeError("Invalid GitHub release metadata: missing assets list.")
 
-    matched_asset = next(
-        (
-            item
-            for item in assets
-            if isinstance(item, dict) and item.get("name") == asset_name
-        ),
-        None,
-    )
+    assets_by_name = {
+        item["name"]: item
+        for item in assets
+        if isinstance(item, dict) and isinstance(item.get("name"), str)
+    }
+    _RELEASE_ASSETS_CACHE[release] = assets_by_name
+    return assets_by_name
+
+
+def _resolve_expected_sha256(release: str, asset_name: str) -> str:
+    matched_asset = _get_release_assets_by_name(release).get(asset_name)
     if matched_asset is None:
         raise RuntimeError(
             f"Cannot find expected python-build-standalone asset in release {release}: {asset_name}"
@@ -105,12 +122,35 @@ def _resolve_expected_sha256(release: str, asset_name: str) -> str:
     return digest.split(":", 1)[1].lower()
 
 
-def _calculate_sha256(file_path: pathlib.Path) -> str:
-    digest = hashlib.sha256()
-    with file_path.open("rb") as source:
-        for chunk in iter(lambda: source.read(1024 * 1024), b""):
-            digest.update(chunk)
-    return digest.hexdigest()
+def _extract_runtime_archive(archive_path: pathlib.Path, target_root: pathlib.Path) -> None:
+    # Extract the top-level python/ tree straight into target_root in one pass,
+    # instead of extracting to a scratch directory and copying it over.
+    prefix = "python/"
+    found_runtime_root = False
+    selected: list[tarfile.TarInfo] = []
+    target_root.mkdir(parents=True, exist_ok=True)
+    with tarfile.open(archive_path, "r:gz") as archive:
+        # Rename every member before extracting anything: tarfile's fallback for
+        # links it cannot create looks the target up by its (renamed) name.
+        for member in archive.getmembers():
+            if member.name == "python":
+                found_runtime_root = True
+                continue
+            if not member.name.startswith(prefix):
+                continue
+            found_runtime_root = True
+            member.name = member.name[len(prefix) :]
+            if member.islnk() and member.linkname.startswith(prefix):
+                member.linkname = member.linkname[len(prefix) :]
+            selected.append(member)
+
+        # extractall defers directory modes and mtimes until every file is in place.
+        archive.extractall(target_root, members=selected)
+
+    if not found_runtime_root:
+        raise RuntimeError(
+            "Invalid python-build-standalone archive layout: missing top-level python/ directory."
+        )
 
 
 def _resolve_runtime_python(runtime_root: pathlib.Path) -> pathlib.Path:
@@ -158,32 +198,18 @@ def main() -> None:
 
     target_runtime_root = runner_temp / "astrbot-cpython-runtime"
     download_archive_path = runner_temp / asset_name
-    extract_root = runner_temp / "astrbot-cpython-runtime-extract"
 
     if target_runtime_root.exists():
         shutil.rmtree(target_runtime_root)
-    if extract_root.exists():
-        shutil.rmtree(extract_root)
-    extract_root.mkdir(parents=True, exist_ok=True)
 
-    _download_with_retries(asset_url, download_archive_path)
-    actual_sha256 = _calculate_sha256(download_archive_path)
+    actual_sha256 = _download_with_retries(asset_url, download_archive_path)
     if actual_sha256 != expected_sha256:
         raise RuntimeError(
             "Downloaded runtime archive sha256 mismatch: "
             + f"expected={expected_sha256} actual={actual_sha256}"
         )
 
-    with tarfile.open(download_archive_path, "r:gz") as archive:
-        archive.extractall(extract_root)
-
-    source_runtime_root = extract_root / "python"
-    if not source_runtime_root.is_dir():
-        raise RuntimeError(
-            "Invalid python-build-standalone archive layout: missing top-level python/ directory."
-        )
-
-    shutil.copytree(source_runtime_root, target_runtime_root, symlinks=sys.platform != "win32")
+    _extract_runtime_archive(download_archive_path, target_runtime_root)
 
     runtime_python = _resolve_runtime_python(target_runtime_root)
     _run_probe(runtime_python, ["-V"], "version")